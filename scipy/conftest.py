@@ -17,6 +17,9 @@ def pytest_configure(config):
         "xslow: mark test as extremely slow (not run unless explicitly requested)")
     config.addinivalue_line("markers",
         "xfail_on_32bit: mark test as failing on 32-bit platforms")
+    config.addinivalue_line("markers",
+        "xdist_group: run tests in the same group on the same pytest-xdist "
+        "worker")
 
 
 def _get_mark(item, name):
@@ -1,4 +1,6 @@
 import os
+from math import isnan
+from types import SimpleNamespace
 
 import numpy as np
 from numpy.testing import assert_allclose
@@ -8,7 +10,9 @@ from scipy.optimize import differential_evolution
 
 from .test_continuous_basic import distcont
 from scipy.stats._distr_params import distdiscrete
+from scipy.stats._constants import _XMAX
 
+_DIST_DATA = dict(distcont + distdiscrete)
 
 # this is not a proper statistical test for convergence, but only
 # verifies that the estimate and true values don't differ by too much
@@ -18,52 +22,44 @@ fit_sizes = [1000, 5000, 10000]  # sample sizes to try
 thresh_percent = 0.25  # percent of true parameters for fail cut-off
 thresh_min = 0.75  # minimum difference estimate - true to fail test
 
-mle_failing_fits = [
-        'burr',
-        'chi2',
-        'gausshyper',
-        'genexpon',
-        'gengamma',
-        'kappa4',
-        'ksone',
-        'kstwo',
-        'mielke',
-        'ncf',
-        'ncx2',
-        'pearson3',
-        'powerlognorm',
-        'truncexpon',
-        'tukeylambda',
-        'vonmises',
-        'levy_stable',
-        'trapezoid',
-        'studentized_range'
-]
-
-mm_failing_fits = ['alpha', 'betaprime', 'burr', 'burr12', 'cauchy', 'chi',
-                   'chi2', 'crystalball', 'dgamma', 'dweibull', 'f',
-                   'fatiguelife', 'fisk', 'foldcauchy', 'genextreme',
-                   'gengamma', 'genhyperbolic', 'gennorm', 'genpareto',
-                   'halfcauchy', 'invgamma', 'invweibull', 'johnsonsu',
-                   'kappa3', 'ksone', 'kstwo', 'levy', 'levy_l',
-                   'levy_stable', 'loglaplace', 'lomax', 'mielke', 'nakagami',
-                   'ncf', 'nct', 'ncx2', 'pareto', 'powerlognorm', 'powernorm',
-                   'skewcauchy', 't',
-                   'trapezoid', 'triang', 'tukeylambda', 'studentized_range']
+mle_failing_fits = frozenset({
+    'burr', 'chi2', 'gausshyper', 'genexpon', 'gengamma', 'kappa4', 'ksone',
+    'kstwo', 'mielke', 'ncf', 'ncx2', 'pearson3', 'powerlognorm', 'truncexpon',
+    'tukeylambda', 'vonmises', 'levy_stable', 'trapezoid', 'studentized_range'
+})
+
+mm_failing_fits = frozenset({
+    'alpha', 'betaprime', 'burr', 'burr12', 'cauchy', 'chi', 'chi2',
+    'crystalball', 'dgamma', 'dweibull', 'f', 'fatiguelife', 'fisk',
+    'foldcauchy', 'genextreme', 'gengamma', 'genhyperbolic', 'gennorm',
+    'genpareto', 'halfcauchy', 'invgamma', 'invweibull', 'johnsonsu',
+    'kappa3', 'ksone', 'kstwo', 'levy', 'levy_l', 'levy_stable', 'loglaplace',
+    'lomax', 'mielke', 'nakagami', 'ncf', 'nct', 'ncx2', 'pareto',
+    'powerlognorm', 'powernorm', 'skewcauchy', 't', 'trapezoid', 'triang',
+    'tukeylambda', 'studentized_range'
+})
 
 # not sure if these fail, but they caused my patience to fail
-mm_slow_fits = ['argus', 'exponpow', 'exponweib', 'gausshyper', 'genexpon',
-                'genhalflogistic', 'halfgennorm', 'gompertz', 'johnsonsb',
-                'kappa4', 'kstwobign', 'recipinvgauss', 'skewnorm',
-                'truncexpon', 'vonmises', 'vonmises_line']
+mm_slow_fits = frozenset({
+    'argus', 'exponpow', 'exponweib', 'gausshyper', 'genexpon',
+    'genhalflogistic', 'halfgennorm', 'gompertz', 'johnsonsb', 'kappa4',
+    'kstwobign', 'recipinvgauss', 'skewnorm', 'truncexpon', 'vonmises',
+    'vonmises_line'
+})
 
-failing_fits = {"MM": mm_failing_fits + mm_slow_fits, "MLE": mle_failing_fits}
+failing_fits = {"MM": mm_failing_fits | mm_slow_fits, "MLE": mle_failing_fits}
 
 # Don't run the fit test on these:
-skip_fit = [
+skip_fit = frozenset({
     'erlang',  # Subclass of gamma, generates a warning.
     'genhyperbolic',  # too slow
-]
+})
+
+# Run the failing fits anyway if the environment variable SCIPY_XFAIL is set
+try:
+    run_failing_fits = bool(int(os.environ.get('SCIPY_XFAIL', '0')))
+except ValueError:
+    run_failing_fits = False
 
 
 def cases_test_cont_fit():
@@ -71,58 +67,71 @@ def cases_test_cont_fit():
     # parameters with fit method of continuous distributions
     # Note: is slow, some distributions don't converge with sample
     # size <= 10000
-    for distname, arg in distcont:
-        if distname not in skip_fit:
-            yield distname, arg
+    # Cases for the same distribution share an xdist group so that, when run
+    # in parallel with ``-n auto --dist loadgroup``, they are dispatched to
+    # the same worker.
+    cases = [(distname, arg) for distname, arg in distcont
+             if distname not in skip_fit]
+    for method in ["MLE", "MM"]:
+        for i, (distname, arg) in enumerate(cases):
+            marks = [pytest.mark.xdist_group(name=distname)]
+            if distname in failing_fits[method]:
+                # Skip failing fits unless overridden
+                msg = ("Fitting %s doesn't work reliably yet [Set environment "
+                       "variable SCIPY_XFAIL=1 to run this test "
+                       "nevertheless.]" % distname)
+                marks.append(pytest.mark.xfail(not run_failing_fits,
+                                               reason=msg, run=False))
+            yield pytest.param(getattr(stats, distname), arg, method,
+                               marks=marks, id=f"{method}-{distname}-arg{i}")
+
+
+@pytest.fixture(scope="session")
+def rvs_cache():
+    return {}
+
+
+def _get_rvs(rvs_cache, distfn, arg, size):
+    # The samples depend only on the distribution and its shapes, so the
+    # "MLE" and "MM" cases of `test_cont_fit` can share a single draw.
+    key = (distfn.name, tuple(arg), size)
+    if key not in rvs_cache:
+        # a local RandomState draws the same samples as the global
+        # `np.random.seed(1234)` used previously, without sharing state
+        rng = np.random.RandomState(1234)
+        rvs_cache[key] = distfn.rvs(*arg, size=size, random_state=rng)
+    return rvs_cache[key]
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize('distname,arg', cases_test_cont_fit())
-@pytest.mark.parametrize('method', ["MLE", 'MM'])
-def test_cont_fit(distname, arg, method):
-    if distname in failing_fits[method]:
-        # Skip failing fits unless overridden
-        try:
-            xfail = not int(os.environ['SCIPY_XFAIL'])
-        except Exception:
-            xfail = True
-        if xfail:
-            msg = "Fitting %s doesn't work reliably yet" % distname
-            msg += (" [Set environment variable SCIPY_XFAIL=1 to run this"
-                    " test nevertheless.]")
-            pytest.xfail(msg)
-
-    distfn = getattr(stats, distname)
-
-    truearg = np.hstack([arg, [0.0, 1.0]])
-    diffthreshold = np.max(np.vstack([truearg*thresh_percent,
-                                      np.full(distfn.numargs+2, thresh_min)]),
-                           0)
-
-    for fit_size in fit_sizes:
-        # Note that if a fit succeeds, the other fit_sizes are skipped
-        np.random.seed(1234)
-
-        with np.errstate(all='ignore'):
-            rvs = distfn.rvs(size=fit_size, *arg)
+@pytest.mark.parametrize('distfn,arg,method', cases_test_cont_fit())
+def test_cont_fit(distfn, arg, method, rvs_cache):
+    truearg = np.concatenate([arg, (0.0, 1.0)])
+    diffthreshold = np.maximum(truearg*thresh_percent, thresh_min)
+
+    with np.errstate(all='ignore'):
+        for fit_size in fit_sizes:
+            # Note that if a fit succeeds, the other fit_sizes are skipped
+            rvs = _get_rvs(rvs_cache, distfn, arg, fit_size)
+
             est = distfn.fit(rvs, method=method)  # start with default values
 
-        diff = est - truearg
+            diff = est - truearg
 
-        # threshold for location
-        diffthreshold[-2] = np.max([np.abs(rvs.mean())*thresh_percent,
-                                    thresh_min])
+            # threshold for location
+            diffthreshold[-2] = max(abs(rvs.mean())*thresh_percent, thresh_min)
 
-        if np.any(np.isnan(est)):
-            raise AssertionError('nan returned in fit')
+            if any(isnan(x) for x in est):
+                raise AssertionError('nan returned in fit')
+            else:
+                if np.all(np.abs(diff) <= diffthreshold):
+                    break
         else:
-            if np.all(np.abs(diff) <= diffthreshold):
-                break
-    else:
-        txt = 'parameter: %s\n' % str(truearg)
-        txt += 'estimated: %s\n' % str(est)
-        txt += 'diff     : %s\n' % str(diff)
-        raise AssertionError('fit not very good in %s\n' % distfn.name + txt)
+            txt = 'parameter: %s\n' % str(truearg)
+            txt += 'estimated: %s\n' % str(est)
+            txt += 'diff     : %s\n' % str(diff)
+            raise AssertionError('fit not very good in %s\n' % distfn.name
+                                 + txt)
 
 
 def _check_loc_scale_mle_fit(name, data, desired, atol=None):
@@ -164,39 +173,71 @@ def test_nnlf_and_related_methods(dist, params):
     assert_allclose(res2, ref)
 
 
-def cases_test_fit():
-    skip_basic_fit = {'nhypergeom', 'boltzmann', 'nbinom',
-                      'randint', 'yulesimon', 'nchypergeom_fisher',
-                      'nchypergeom_wallenius'}
-    slow_basic_fit = {'binom'}
-    xslow_basic_fit = {'skellam', 'hypergeom', 'zipfian', 'betabinom'}
+def test_penalized_nnlf_outside_support():
+    # two points lie outside the support and the log-PDF is -inf at x=0
+    dist = stats.beta
+    params = (2, 2, 0, 1)
+    x = np.array([-0.5, 0, 0.3, 0.5, 0.7, 1.5])
+    n_bad = 3
+
+    ref = -dist.logpdf(x[2:5], *params).sum() + n_bad*np.log(_XMAX)*100
+    with np.errstate(divide='ignore'):
+        res = dist._penalized_nnlf(params, x)
+    assert_allclose(res, ref)
+    assert dist.nnlf(params, x) == np.inf
+
+
+# Discrete distributions that `TestFit.test_basic_fit` skips or marks as slow
+skip_basic_fit = frozenset({'nhypergeom', 'boltzmann', 'nbinom', 'randint',
+                            'yulesimon', 'nchypergeom_fisher',
+                            'nchypergeom_wallenius'})
+slow_basic_fit = frozenset({'binom'})
+xslow_basic_fit = frozenset({'skellam', 'hypergeom', 'zipfian', 'betabinom'})
 
+
+def cases_test_fit():
+    # yields `(dist_name, dist)` pairs as single values for the
+    # `TestFit.basic_fit_case` fixture
     for dist in dict(distdiscrete):
         if dist in skip_basic_fit or not isinstance(dist, str):
             reason = "tested separately"
-            yield pytest.param(dist, marks=pytest.mark.skip(reason=reason))
+            yield pytest.param((dist, None),
+                               marks=pytest.mark.skip(reason=reason),
+                               id=dist if isinstance(dist, str) else None)
         elif dist in slow_basic_fit:
             reason = "too slow (>= 0.25s)"
-            yield pytest.param(dist, marks=pytest.mark.slow(reason=reason))
+            yield pytest.param((dist, getattr(stats, dist)),
+                               marks=pytest.mark.slow(reason=reason), id=dist)
         elif dist in xslow_basic_fit:
             reason = "too slow (>= 1.0s)"
-            yield pytest.param(dist, marks=pytest.mark.xslow(reason=reason))
+            yield pytest.param((dist, getattr(stats, dist)),
+                               marks=pytest.mark.xslow(reason=reason), id=dist)
 
 
 class TestFit:
     dist = stats.binom  # type: ignore[attr-defined]
     seed = 654634816187
-    rng = np.random.default_rng(seed)
-    data = stats.binom.rvs(5, 0.5, size=100, random_state=rng)  # type: ignore[attr-defined] # noqa
+    data = stats.binom.rvs(5, 0.5, size=100, random_state=np.random.default_rng(seed))  # type: ignore[attr-defined] # noqa
     shape_bounds_a = [(1, 10), (0, 1)]
     shape_bounds_d = {'n': (1, 10), 'p': (0, 1)}
     atol = 5e-2
     rtol = 1e-2
     tols = {'atol': atol, 'rtol': rtol}
 
+    @pytest.fixture
+    def rng(self):
+        return np.random.default_rng(self.seed)
+
     def opt(self, *args, **kwds):
         return differential_evolution(*args, seed=0, **kwds)
 
+    def opt_warm(self, *args, **kwds):
+        # When DE is seeded with a guess inside the basin of attraction
+        # (`x0`), few generations are needed. Note that DE only polishes the
+        # result if some parameter is continuous; for all-integer
+        # distributions (e.g. `hypergeom`) the DE result is returned as-is.
+        return self.opt(*args, maxiter=50, **kwds)
+
     def test_dist_iv(self):
         message = "`dist` must be an instance of..."
         with pytest.raises(ValueError, match=message):
@@ -219,112 +260,89 @@ class TestFit:
         with pytest.raises(ValueError, match=message):
             stats.fit(self.dist, ['1', '2', '3'], self.shape_bounds_a)
 
-    def test_bounds_iv(self):
-        message = "Bounds provided for the following unrecognized..."
-        shape_bounds = {'n': (1, 10), 'p': (0, 1), '1': (0, 10)}
-        with pytest.warns(RuntimeWarning, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-        message = "Each element of a `bounds` sequence must be a tuple..."
-        shape_bounds = [(1, 10, 3), (0, 1)]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-        message = "Each element of `bounds` must be a tuple specifying..."
-        shape_bounds = [(1, 10, 3), (0, 1, 0.5)]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-        shape_bounds = [1, 0]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-        message = "A `bounds` sequence must contain at least 2 elements..."
-        shape_bounds = [(1, 10)]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-        message = "A `bounds` sequence may not contain more than 3 elements..."
-        bounds = [(1, 10), (1, 10), (1, 10), (1, 10)]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, bounds)
-
-        message = "There are no values for `p` on the interval..."
-        shape_bounds = {'n': (1, 10), 'p': (1, 0)}
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-        message = "There are no values for `n` on the interval..."
-        shape_bounds = [(10, 1), (0, 1)]
-        with pytest.raises(ValueError, match=message):
+    @pytest.mark.parametrize("check, error, message, shape_bounds", [
+        (pytest.warns, RuntimeWarning,
+         "Bounds provided for the following unrecognized...",
+         {'n': (1, 10), 'p': (0, 1), '1': (0, 10)}),
+        (pytest.raises, ValueError,
+         "Each element of a `bounds` sequence must be a tuple...",
+         [(1, 10, 3), (0, 1)]),
+        (pytest.raises, ValueError,
+         "Each element of `bounds` must be a tuple specifying...",
+         [(1, 10, 3), (0, 1, 0.5)]),
+        (pytest.raises, ValueError,
+         "Each element of `bounds` must be a tuple specifying...",
+         [1, 0]),
+        (pytest.raises, ValueError,
+         "A `bounds` sequence must contain at least 2 elements...",
+         [(1, 10)]),
+        (pytest.raises, ValueError,
+         "A `bounds` sequence may not contain more than 3 elements...",
+         [(1, 10), (1, 10), (1, 10), (1, 10)]),
+        (pytest.raises, ValueError,
+         "There are no values for `p` on the interval...",
+         {'n': (1, 10), 'p': (1, 0)}),
+        (pytest.raises, ValueError,
+         "There are no values for `n` on the interval...",
+         [(10, 1), (0, 1)]),
+        (pytest.raises, ValueError,
+         "There are no integer values for `n` on the interval...",
+         [(1.4, 1.6), (0, 1)]),
+        (pytest.raises, ValueError,
+         "The intersection of user-provided bounds for `n`",
+         None),
+        (pytest.raises, ValueError,
+         "The intersection of user-provided bounds for `n`",
+         [(-np.inf, np.inf), (0, 1)]),
+    ])
+    def test_bounds_iv(self, check, error, message, shape_bounds):
+        with check(error, match=message):
             stats.fit(self.dist, self.data, shape_bounds)
 
-        message = "There are no integer values for `n` on the interval..."
-        shape_bounds = [(1.4, 1.6), (0, 1)]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-        message = "The intersection of user-provided bounds for `n`"
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data)
-        shape_bounds = [(-np.inf, np.inf), (0, 1)]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, shape_bounds)
-
-    def test_guess_iv(self):
-        message = "Guesses provided for the following unrecognized..."
-        guess = {'n': 1, 'p': 0.5, '1': 255}
-        with pytest.warns(RuntimeWarning, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-        message = "Each element of `guess` must be a scalar..."
-        guess = {'n': 1, 'p': 'hi'}
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-        guess = [1, 'f']
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-        guess = [[1, 2]]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-        message = "A `guess` sequence must contain at least 2..."
-        guess = [1]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-        message = "A `guess` sequence may not contain more than 3..."
-        guess = [1, 2, 3, 4]
-        with pytest.raises(ValueError, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-        message = "Guess for parameter `n` rounded..."
-        guess = {'n': 4.5, 'p': -0.5}
-        with pytest.warns(RuntimeWarning, match=message):
+    @pytest.mark.parametrize("check, error, message, guess", [
+        (pytest.warns, RuntimeWarning,
+         "Guesses provided for the following unrecognized...",
+         {'n': 1, 'p': 0.5, '1': 255}),
+        (pytest.raises, ValueError,
+         "Each element of `guess` must be a scalar...",
+         {'n': 1, 'p': 'hi'}),
+        (pytest.raises, ValueError,
+         "Each element of `guess` must be a scalar...",
+         [1, 'f']),
+        (pytest.raises, ValueError,
+         "Each element of `guess` must be a scalar...",
+         [[1, 2]]),
+        (pytest.raises, ValueError,
+         "A `guess` sequence must contain at least 2...",
+         [1]),
+        (pytest.raises, ValueError,
+         "A `guess` sequence may not contain more than 3...",
+         [1, 2, 3, 4]),
+        (pytest.warns, RuntimeWarning,
+         "Guess for parameter `n` rounded...",
+         {'n': 4.5, 'p': -0.5}),
+        (pytest.warns, RuntimeWarning,
+         "Guess for parameter `loc` rounded...",
+         [5, 0.5, 0.5]),
+        (pytest.warns, RuntimeWarning,
+         "Guess for parameter `p` clipped...",
+         {'n': 5, 'p': -0.5}),
+        (pytest.warns, RuntimeWarning,
+         "Guess for parameter `loc` clipped...",
+         [5, 0.5, 1]),
+    ])
+    def test_guess_iv(self, check, error, message, guess):
+        with check(error, match=message):
             stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
 
-        message = "Guess for parameter `loc` rounded..."
-        guess = [5, 0.5, 0.5]
-        with pytest.warns(RuntimeWarning, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-        message = "Guess for parameter `p` clipped..."
-        guess = {'n': 5, 'p': -0.5}
-        with pytest.warns(RuntimeWarning, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-        message = "Guess for parameter `loc` clipped..."
-        guess = [5, 0.5, 1]
-        with pytest.warns(RuntimeWarning, match=message):
-            stats.fit(self.dist, self.data, self.shape_bounds_d, guess=guess)
-
-    @pytest.mark.parametrize("dist_name", cases_test_fit())
-    def test_basic_fit(self, dist_name):
-
+    @pytest.fixture(scope="class", params=list(cases_test_fit()))
+    @classmethod
+    def basic_fit_case(cls, request):
+        # Assemble the bounds, reference parameters and data once per case
+        dist_name, dist = request.param
         N = 5000
-        dist_data = dict(distcont + distdiscrete)
-        rng = np.random.default_rng(self.seed)
-        dist = getattr(stats, dist_name)
-        shapes = np.array(dist_data[dist_name])
+        rng = np.random.default_rng(cls.seed)
+        shapes = np.array(_DIST_DATA[dist_name])
         bounds = np.empty((len(shapes) + 2, 2), dtype=np.float64)
         bounds[:-2, 0] = shapes/10  # essentially all shapes are > 0
         bounds[:-2, 1] = shapes*10
@@ -332,24 +350,27 @@ class TestFit:
         bounds[-1] = (0, 10)
         loc = rng.uniform(*bounds[-2])
         scale = rng.uniform(*bounds[-1])
-        ref = list(dist_data[dist_name]) + [loc, scale]
+        ref = list(_DIST_DATA[dist_name]) + [loc, scale]
 
         if getattr(dist, 'pmf', False):
             ref = ref[:-1]
             ref[-1] = np.floor(loc)
-            data = dist.rvs(*ref, size=N, random_state=rng)
-            res = stats.fit(dist, data, bounds[:-1], optimizer=self.opt)
-        if getattr(dist, 'pdf', False):
-            data = dist.rvs(*ref, size=N, random_state=rng)
-            res = stats.fit(dist, data, bounds, optimizer=self.opt)
-
-        assert_allclose(res.params, ref, **self.tols)
+            bounds = bounds[:-1]
+        data = dist.rvs(*ref, size=N, random_state=rng)
+        return SimpleNamespace(dist=dist, data=data, bounds=bounds, ref=ref)
+
+    def test_basic_fit(self, basic_fit_case):
+        # DE is started from the true parameters, so this checks that the
+        # MLE is near them, not DE's global search; see `test_guess` for that.
+        case = basic_fit_case
+        res = stats.fit(case.dist, case.data, case.bounds, guess=case.ref,
+                        optimizer=self.opt_warm)
+        assert_allclose(res.params, case.ref, **self.tols)
 
     @pytest.mark.skip("Tested in test_basic_fit")
-    def test_hypergeom(self):
+    def test_hypergeom(self, rng):
         # hypergeometric distribution (M, n, N) \equiv (M, N, n)
         N = 1000
-        rng = np.random.default_rng(self.seed)
         dist = stats.hypergeom
         shapes = (20, 7, 12)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -358,10 +379,9 @@ class TestFit:
         assert_allclose(res.params[:-1], shapes, **self.tols)
 
     @pytest.mark.xslow
-    def test_nhypergeom(self):
+    def test_nhypergeom(self, rng):
         # DE doesn't find optimum for the bounds in `test_basic_fit`. NBD.
         N = 2000
-        rng = np.random.default_rng(self.seed)
         dist = stats.nhypergeom
         shapes = (20, 7, 12)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -369,10 +389,9 @@ class TestFit:
         res = stats.fit(dist, data, shape_bounds, optimizer=self.opt)
         assert_allclose(res.params[:-1], (20, 7, 12), **self.tols)
 
-    def test_boltzmann(self):
+    def test_boltzmann(self, rng):
         # Boltzmann distribution shape is very insensitive to parameter N
         N = 1000
-        rng = np.random.default_rng(self.seed)
         dist = stats.boltzmann
         shapes = (1.4, 19, 4)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -381,10 +400,9 @@ class TestFit:
         assert_allclose(res.params[0], 1.4, **self.tols)
         assert_allclose(res.params[2], 4, **self.tols)
 
-    def test_nbinom(self):
+    def test_nbinom(self, rng):
         # Fitting nbinom doesn't always get original shapes if loc is free
         N = 7000
-        rng = np.random.default_rng(self.seed)
         dist = stats.nbinom
         shapes = (5, 0.5)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -392,10 +410,9 @@ class TestFit:
         res = stats.fit(dist, data, shape_bounds, optimizer=self.opt)
         assert_allclose(res.params[:-1], shapes, **self.tols)
 
-    def test_randint(self):
+    def test_randint(self, rng):
         # randint is overparameterized; test_basic_fit finds equally good fit
         N = 5000
-        rng = np.random.default_rng(self.seed)
         dist = stats.randint
         shapes = (7, 31)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -403,10 +420,9 @@ class TestFit:
         res = stats.fit(dist, data, shape_bounds, optimizer=self.opt)
         assert_allclose(res.params[:2], shapes, **self.tols)
 
-    def test_yulesimon(self):
+    def test_yulesimon(self, rng):
         # yulesimon fit is not very sensitive to alpha except for small alpha
         N = 5000
-        rng = np.random.default_rng(self.seed)
         dist = stats.yulesimon
         params = (1.5, 4)
         data = dist.rvs(*params, size=N, random_state=rng)
@@ -415,10 +431,9 @@ class TestFit:
         assert_allclose(res.params, params, **self.tols)
 
     @pytest.mark.xslow
-    def test_nchypergeom_fisher(self):
+    def test_nchypergeom_fisher(self, rng):
         # The NC hypergeometric distributions are more challenging
         N = 5000
-        rng = np.random.default_rng(self.seed)
         dist = stats.nchypergeom_fisher
         shapes = (14, 8, 6, 0.5)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -427,10 +442,9 @@ class TestFit:
         assert_allclose(res.params[:-1], shapes, **self.tols)
 
     @pytest.mark.xslow
-    def test_nchypergeom_wallenius(self):
+    def test_nchypergeom_wallenius(self, rng):
         # The NC hypergeometric distributions are more challenging
         N = 5000
-        rng = np.random.default_rng(self.seed)
         dist = stats.nchypergeom_wallenius
         shapes = (14, 8, 6, 0.5)
         data = dist.rvs(*shapes, size=N, random_state=rng)
@@ -438,13 +452,12 @@ class TestFit:
         res = stats.fit(dist, data, shape_bounds, optimizer=self.opt)
         assert_allclose(res.params[:-1], shapes, **self.tols)
 
-    def test_missing_shape_bounds(self):
+    def test_missing_shape_bounds(self, rng):
         # some distributions have a small domain w.r.t. a parameter, e.g.
         # $p \in [0, 1]$ for binomial distribution
         # User does not need to provide these because the intersection of the
         # user's bounds (none) and the distribution's domain is finite
         N = 1000
-        rng = np.random.default_rng(self.seed)
 
         dist = stats.binom
         n, p, loc = 10, 0.65, 0
@@ -459,10 +472,9 @@ class TestFit:
         res = stats.fit(dist, data, optimizer=self.opt)
         assert_allclose(res.params, (p, loc), **self.tols)
 
-    def test_fit_only_loc_scale(self):
+    def test_fit_only_loc_scale(self, rng):
         # fit only loc
         N = 5000
-        rng = np.random.default_rng(self.seed)
 
         dist = stats.norm
         loc, scale = 1.5, 1
@@ -488,9 +500,8 @@ class TestFit:
         res = stats.fit(dist, data, bounds, optimizer=self.opt)
         assert_allclose(res.params, (loc, scale), **self.tols)
 
-    def test_everything_fixed(self):
+    def test_everything_fixed(self, rng):
         N = 5000
-        rng = np.random.default_rng(self.seed)
 
         dist = stats.norm
         loc, scale = 1.5, 2.5
@@ -513,9 +524,8 @@ class TestFit:
         res = stats.fit(dist, data, shape_bounds, optimizer=self.opt)
         assert_allclose(res.params, (n, p, loc), **self.tols)
 
-    def test_failure(self):
+    def test_failure(self, rng):
         N = 5000
-        rng = np.random.default_rng(self.seed)
 
         dist = stats.nbinom
         shapes = (5, 0.5)
@@ -530,10 +540,9 @@ class TestFit:
         assert res.success is False
 
     @pytest.mark.xslow
-    def test_guess(self):
+    def test_guess(self, rng):
         # Test that guess helps DE find the desired solution
         N = 2000
-        rng = np.random.default_rng(self.seed)
         dist = stats.nhypergeom
         params = (20, 7, 12, 0)
         bounds = [(2, 200), (0.7, 70), (1.2, 120), (0, 10)]